@@ -76,9 +76,12 @@ struct ItemWithPosition {
 // MARK: - Parser Utilities
 
 class PromptParser {
+    // Compiled once; Prompt.variables and Prompt.calledPrompts hit these on every access
+    private static let variableRegex = try? NSRegularExpression(pattern: "\\{\\{(\\w+)\\}\\}")
+    private static let promptCallRegex = try? NSRegularExpression(pattern: "(\\w+)\\(\\)")
+    
     static func extractVariables(from text: String) -> [String] {
-        let pattern = "\\{\\{(\\w+)\\}\\}"
-        guard let regex = try? NSRegularExpression(pattern: pattern) else { return [] }
+        guard let regex = variableRegex else { return [] }
         
         let matches = regex.matches(in: text, range: NSRange(text.startIndex..., in: text))
         var variables: [String] = []
@@ -93,8 +96,7 @@ class PromptParser {
     }
     
     static func extractPromptCalls(from text: String) -> [String] {
-        let pattern = "(\\w+)\\(\\)"
-        guard let regex = try? NSRegularExpression(pattern: pattern) else { return [] }
+        guard let regex = promptCallRegex else { return [] }
         
         let matches = regex.matches(in: text, range: NSRange(text.startIndex..., in: text))
         var calls: [String] = []
@@ -112,8 +114,7 @@ class PromptParser {
         var items: [ItemWithPosition] = []
         
         // Find prompt calls
-        let promptPattern = "(\\w+)\\(\\)"
-        if let promptRegex = try? NSRegularExpression(pattern: promptPattern) {
+        if let promptRegex = promptCallRegex {
             let matches = promptRegex.matches(in: text, range: NSRange(text.startIndex..., in: text))
             for match in matches {
                 if let range = Range(match.range(at: 1), in: text),
@@ -130,8 +131,7 @@ class PromptParser {
         }
         
         // Find variables
-        let varPattern = "\\{\\{(\\w+)\\}\\}"
-        if let varRegex = try? NSRegularExpression(pattern: varPattern) {
+        if let varRegex = variableRegex {
             let matches = varRegex.matches(in: text, range: NSRange(text.startIndex..., in: text))
             for match in matches {
                 if let range = Range(match.range(at: 1), in: text),